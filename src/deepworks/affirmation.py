@@ -1,9 +1,15 @@
 """Affirmation module for deepworks."""
 
+import bisect
+import os
 import random
 from typing import Optional
 
-VALID_MOODS = [
+import numpy as np
+
+# Ordered option lists back the frozensets used for validation, keeping
+# error messages and category indices deterministic
+_MOODS = (
     "happy",
     "stressed",
     "anxious",
@@ -11,8 +17,13 @@ VALID_MOODS = [
     "frustrated",
     "motivated",
     "neutral",
-]
-VALID_CATEGORIES = ["motivation", "confidence", "persistence", "self-care", "growth"]
+)
+_CATEGORIES = ("motivation", "confidence", "persistence", "self-care", "growth")
+
+VALID_MOODS = frozenset(_MOODS)
+VALID_CATEGORIES = frozenset(_CATEGORIES)
+_VALID_MOODS_MSG = ", ".join(_MOODS)
+_VALID_CATEGORIES_MSG = ", ".join(_CATEGORIES)
 
 # Affirmation database - developer focused
 AFFIRMATIONS = [
@@ -134,17 +145,49 @@ AFFIRMATIONS = [
 
 # Mood to category mappings
 MOOD_CATEGORY_MAP = {
-    "happy": ["motivation", "growth"],
-    "stressed": ["self-care", "persistence"],
-    "anxious": ["confidence", "self-care"],
-    "tired": ["self-care", "motivation"],
-    "frustrated": ["persistence", "confidence"],
-    "motivated": ["motivation", "growth"],
-    "neutral": ["motivation", "confidence"],
+    "happy": ("motivation", "growth"),
+    "stressed": ("self-care", "persistence"),
+    "anxious": ("confidence", "self-care"),
+    "tired": ("self-care", "motivation"),
+    "frustrated": ("persistence", "confidence"),
+    "motivated": ("motivation", "growth"),
+    "neutral": ("motivation", "confidence"),
 }
 
 ENERGY_ORDER = ["low", "medium", "high"]
 
+# Structure-of-arrays view of AFFIRMATIONS with categories and energy
+# levels pre-encoded as integer indices
+MOOD_INDEX = {mood: i for i, mood in enumerate(_MOODS)}
+CATEGORY_INDEX = {cat: i for i, cat in enumerate(_CATEGORIES)}
+ENERGY_INDEX = {level: i for i, level in enumerate(ENERGY_ORDER)}
+
+# Each template split around its single {name} placeholder
+_TEMPLATE_PARTS = [tuple(a["text"].split("{name}", 1)) for a in AFFIRMATIONS]
+_CAT_IDX = np.array(
+    [CATEGORY_INDEX[a["category"]] for a in AFFIRMATIONS], dtype=np.int8
+)
+_ENERGY_IDX = np.array([ENERGY_INDEX[a["energy"]] for a in AFFIRMATIONS], dtype=np.int8)
+
+# MOOD_CATEGORY_MAP with categories encoded as indices, in order of preference
+_MOOD_CATEGORY_IDX = {
+    mood: tuple(CATEGORY_INDEX[cat] for cat in cats)
+    for mood, cats in MOOD_CATEGORY_MAP.items()
+}
+_DEFAULT_PREFS = (CATEGORY_INDEX["motivation"],)
+
+# Shared generator for unseeded calls, so each call does not re-seed a new
+# Random instance from the OS and the global random state is never touched
+_UNSEEDED_RNG = random.Random()
+
+# Reseed in forked children, as the stdlib does for the module-level random
+# functions, so worker processes do not all draw the same sequence
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_UNSEEDED_RNG.seed)
+
+# Energy multiplier by distance between affirmation and user energy level
+_ENERGY_WEIGHTS = np.array([2.0, 1.5, 1.0])
+
 
 def get_affirmation(
     name: str,
@@ -274,33 +317,38 @@ def get_affirmation(
     >>> "Developer" in affirmation["text"]
     True
     """
-    _validate_inputs(name, mood, energy, category, seed)
+    mood_key, category_key = _validate_inputs(name, mood, energy, category, seed)
 
-    rng = random.Random(seed)
+    rng = random.Random(seed) if seed is not None else _UNSEEDED_RNG
 
     display_name = _sanitize_name(name)
-    energy_cat = _get_energy_category(energy)
-    preferred_categories = _get_preferred_categories(mood, category)
+    key = (
+        MOOD_INDEX[mood_key],
+        _get_energy_category(energy),
+        CATEGORY_INDEX.get(category_key, -1),
+    )
 
-    candidates = _weight_affirmations(preferred_categories, energy_cat)
-    selected = _weighted_random_choice(candidates, rng)
-
-    personalized_text = selected["text"].replace("{name}", display_name)
-    mood_alignment = _calculate_alignment(selected, preferred_categories, energy_cat)
+    idx = _weighted_random_choice(_CUM_WEIGHT_CACHE[key], rng)
+    prefix, suffix = _TEMPLATE_PARTS[idx]
 
     return {
-        "text": personalized_text,
-        "category": selected["category"],
-        "mood_alignment": mood_alignment,
+        "text": f"{prefix}{display_name}{suffix}",
+        "category": AFFIRMATIONS[idx]["category"],
+        "mood_alignment": _ALIGNMENT_CACHE[key][idx],
     }
 
 
 def _validate_inputs(
     name: str, mood: str, energy: int, category: Optional[str], seed: Optional[int]
-) -> None:
+) -> tuple[str, Optional[str]]:
     """
     Validate all input parameters.
 
+    Returns
+    -------
+    tuple
+        (mood, category) lowercased, with category None if not provided.
+
     Raises
     ------
     TypeError
@@ -308,16 +356,30 @@ def _validate_inputs(
     ValueError
         If parameters have invalid values.
     """
+    # Fast path for the common case of valid, already lowercase inputs;
+    # anything else goes through the full checks below
+    if (
+        type(name) is str
+        and type(mood) is str
+        and mood in VALID_MOODS
+        and type(energy) is int
+        and 1 <= energy <= 10
+        and (
+            category is None or (type(category) is str and category in VALID_CATEGORIES)
+        )
+        and (seed is None or type(seed) is int)
+    ):
+        return mood, category
+
     if not isinstance(name, str):
         raise TypeError(f"name must be a string, got {type(name).__name__}")
 
     if not isinstance(mood, str):
         raise TypeError(f"mood must be a string, got {type(mood).__name__}")
 
-    if mood.lower() not in VALID_MOODS:
-        raise ValueError(
-            f"Invalid mood '{mood}'. Must be one of: {', '.join(VALID_MOODS)}"
-        )
+    mood_key = mood.lower()
+    if mood_key not in VALID_MOODS:
+        raise ValueError(f"Invalid mood '{mood}'. Must be one of: {_VALID_MOODS_MSG}")
 
     if not isinstance(energy, int) or isinstance(energy, bool):
         raise TypeError(f"energy must be an integer, got {type(energy).__name__}")
@@ -325,17 +387,21 @@ def _validate_inputs(
     if energy < 1 or energy > 10:
         raise ValueError("energy must be between 1 and 10")
 
+    category_key = None
     if category is not None:
         if not isinstance(category, str):
             raise TypeError(f"category must be a string, got {type(category).__name__}")
-        if category.lower() not in VALID_CATEGORIES:
+        category_key = category.lower()
+        if category_key not in VALID_CATEGORIES:
             raise ValueError(
-                f"Invalid category '{category}'. Must be one of: {', '.join(VALID_CATEGORIES)}"
+                f"Invalid category '{category}'. Must be one of: {_VALID_CATEGORIES_MSG}"
             )
 
     if seed is not None and not isinstance(seed, int):
         raise TypeError(f"seed must be an integer, got {type(seed).__name__}")
 
+    return mood_key, category_key
+
 
 def _sanitize_name(name: str) -> str:
     """
@@ -355,9 +421,9 @@ def _sanitize_name(name: str) -> str:
     return stripped.title() if stripped else "Developer"
 
 
-def _get_energy_category(energy: int) -> str:
+def _get_energy_category(energy: int) -> int:
     """
-    Convert numeric energy level to category.
+    Convert numeric energy level to an energy category index.
 
     Parameters
     ----------
@@ -366,130 +432,103 @@ def _get_energy_category(energy: int) -> str:
 
     Returns
     -------
-    str
-        Energy category: 'low', 'medium', or 'high'.
+    int
+        Index into ENERGY_ORDER: 0 ('low'), 1 ('medium'), or 2 ('high').
     """
     if energy <= 3:
-        return "low"
+        return 0
     elif energy <= 7:
-        return "medium"
+        return 1
     else:
-        return "high"
+        return 2
 
 
-def _get_preferred_categories(mood: str, category: Optional[str]) -> list[str]:
+def _get_preferred_categories(mood: str, category: Optional[str]) -> tuple[int, ...]:
     """
-    Get preferred affirmation categories based on mood.
+    Get preferred affirmation category indices based on mood.
 
     Parameters
     ----------
     mood : str
-        User's current mood.
+        User's current mood, lowercased.
     category : str or None
-        Explicit category override.
+        Explicit category override, lowercased.
 
     Returns
     -------
-    list of str
-        Ordered list of preferred categories.
+    tuple of int
+        Indices into CATEGORY_INDEX, in order of preference.
     """
     if category:
-        return [category.lower()]
-    return MOOD_CATEGORY_MAP.get(mood.lower(), ["motivation"])
+        return (CATEGORY_INDEX[category],)
+    return _MOOD_CATEGORY_IDX.get(mood, _DEFAULT_PREFS)
 
 
 def _weight_affirmations(
-    preferred_categories: list[str], energy_cat: str
-) -> list[tuple[dict, float]]:
+    preferred_categories: tuple[int, ...], energy_cat: int
+) -> np.ndarray:
     """
     Weight affirmations based on category and energy match.
 
     Parameters
     ----------
-    preferred_categories : list of str
-        Preferred categories in order of preference.
-    energy_cat : str
-        User's energy category.
+    preferred_categories : tuple of int
+        Preferred category indices in order of preference.
+    energy_cat : int
+        User's energy category index.
 
     Returns
     -------
-    list of tuple
-        List of (affirmation, weight) tuples.
+    np.ndarray
+        Weights aligned with the entries of AFFIRMATIONS.
     """
-    candidates = []
-
-    for affirmation in AFFIRMATIONS:
-        weight = 1.0
-
-        # Category match weighting
-        if affirmation["category"] in preferred_categories:
-            idx = preferred_categories.index(affirmation["category"])
-            weight *= 3.0 if idx == 0 else 2.0
-        else:
-            weight *= 0.5
-
-        # Energy match weighting
-        if affirmation["energy"] == energy_cat:
-            weight *= 2.0
-        elif (
-            abs(
-                ENERGY_ORDER.index(affirmation["energy"])
-                - ENERGY_ORDER.index(energy_cat)
-            )
-            == 1
-        ):
-            weight *= 1.5
+    # Category match weighting, looked up per affirmation from a small table
+    cat_weight = np.full(len(CATEGORY_INDEX), 0.5)
+    cat_weight[list(preferred_categories[1:])] = 2.0
+    cat_weight[preferred_categories[0]] = 3.0
 
-        candidates.append((affirmation, weight))
+    # Energy match weighting by distance between energy levels
+    distance = np.abs(_ENERGY_IDX - energy_cat)
 
-    return candidates
+    return cat_weight[_CAT_IDX] * _ENERGY_WEIGHTS[distance]
 
 
-def _weighted_random_choice(
-    candidates: list[tuple[dict, float]], rng: random.Random
-) -> dict:
+def _weighted_random_choice(cum_weights: tuple[float, ...], rng: random.Random) -> int:
     """
-    Select an affirmation using weighted random selection.
+    Select an affirmation index using weighted random selection.
 
     Parameters
     ----------
-    candidates : list of tuple
-        List of (affirmation, weight) tuples.
+    cum_weights : tuple of float
+        Cumulative weights aligned with the entries of AFFIRMATIONS.
     rng : random.Random
         Random number generator instance.
 
     Returns
     -------
-    dict
-        Selected affirmation.
+    int
+        Index of the selected affirmation.
     """
-    total = sum(w for _, w in candidates)
-    r = rng.uniform(0, total)
-
-    cumulative = 0
-    for affirmation, weight in candidates:
-        cumulative += weight
-        if r <= cumulative:
-            return affirmation
-
-    # Fallback for floating-point edge cases
-    return candidates[-1][0]
+    # Binary search keeps the pick O(log n) as the database grows; capping
+    # the search at the last index guards against floating-point overshoot
+    r = rng.random() * cum_weights[-1]
+    return bisect.bisect(cum_weights, r, 0, len(cum_weights) - 1)
 
 
 def _calculate_alignment(
-    selected: dict, preferred_categories: list[str], energy_cat: str
+    idx: int, preferred_categories: tuple[int, ...], energy_cat: int
 ) -> float:
     """
     Calculate how well the affirmation aligns with user's mood/energy.
 
     Parameters
     ----------
-    selected : dict
-        The selected affirmation.
-    preferred_categories : list of str
-        User's preferred categories.
-    energy_cat : str
-        User's energy category.
+    idx : int
+        Index of the affirmation in AFFIRMATIONS.
+    preferred_categories : tuple of int
+        User's preferred category indices.
+    energy_cat : int
+        User's energy category index.
 
     Returns
     -------
@@ -497,8 +536,45 @@ def _calculate_alignment(
         Alignment score between 0.0 and 1.0.
     """
     score = 0.5  # Base score
-    if selected["category"] in preferred_categories:
+    if _CAT_IDX[idx] in preferred_categories:
         score += 0.3
-    if selected["energy"] == energy_cat:
+    if _ENERGY_IDX[idx] == energy_cat:
         score += 0.2
     return round(min(score, 1.0), 2)
+
+
+def _build_lookup_tables() -> tuple[dict, dict]:
+    """
+    Precompute cumulative weights and alignment scores for every input.
+
+    Selection only depends on the mood, the energy category and the
+    optional category override, so all combinations are evaluated once
+    at import time.
+
+    Returns
+    -------
+    tuple of dict
+        (cumulative weights, alignments), both keyed by the
+        (mood, energy category, category) index triple, with -1 for no
+        category override, and holding one value per entry of AFFIRMATIONS.
+    """
+    weight_table = {}
+    alignment_table = {}
+
+    for mood in _MOODS:
+        for energy_cat in range(len(ENERGY_ORDER)):
+            for category in [None, *_CATEGORIES]:
+                preferred = _get_preferred_categories(mood, category)
+                key = (MOOD_INDEX[mood], energy_cat, CATEGORY_INDEX.get(category, -1))
+                weight_table[key] = tuple(
+                    np.cumsum(_weight_affirmations(preferred, energy_cat)).tolist()
+                )
+                alignment_table[key] = tuple(
+                    _calculate_alignment(idx, preferred, energy_cat)
+                    for idx in range(len(AFFIRMATIONS))
+                )
+
+    return weight_table, alignment_table
+
+
+_CUM_WEIGHT_CACHE, _ALIGNMENT_CACHE = _build_lookup_tables()
@@ -4,8 +4,12 @@ import random
 import warnings
 from typing import Optional
 
-VALID_BREAK_TYPES = ["active", "rest", "social", "mindful", "any"]
-VALID_DURATIONS = [5, 10, 15, 20]
+_BREAK_TYPES = ("active", "rest", "social", "mindful", "any")
+_DURATIONS = (5, 10, 15, 20)
+VALID_BREAK_TYPES = frozenset(_BREAK_TYPES)
+VALID_DURATIONS = frozenset(_DURATIONS)
+_VALID_BREAK_TYPES_MSG = ", ".join(_BREAK_TYPES)
+_VALID_DURATIONS_MSG = str(list(_DURATIONS))
 
 # Database
 ACTIVITIES = [
@@ -289,14 +293,18 @@ def _validate_inputs(
     if energy_level < 1 or energy_level > 10:
         raise ValueError("energy_level must be between 1 and 10")
 
-    if break_type not in VALID_BREAK_TYPES:
+    if not isinstance(break_type, str) or break_type not in VALID_BREAK_TYPES:
         raise ValueError(
-            f"Invalid break_type '{break_type}'. Must be one of: {', '.join(VALID_BREAK_TYPES)}"
+            f"Invalid break_type '{break_type}'. Must be one of: {_VALID_BREAK_TYPES_MSG}"
         )
 
-    if duration not in VALID_DURATIONS:
+    try:
+        valid_duration = duration in VALID_DURATIONS
+    except TypeError:  # unhashable, e.g. a list
+        valid_duration = False
+    if not valid_duration:
         raise ValueError(
-            f"Invalid duration '{duration}'. Must be one of: {VALID_DURATIONS}"
+            f"Invalid duration '{duration}'. Must be one of: {_VALID_DURATIONS_MSG}"
         )
 
     if not isinstance(indoor_only, bool):
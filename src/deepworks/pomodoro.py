@@ -4,7 +4,9 @@ import pandas as pd
 import warnings
 from typing import Optional
 
-VALID_TECHNIQUES = ["pomodoro", "52-17", "90-20", "custom"]
+_TECHNIQUES = ("pomodoro", "52-17", "90-20", "custom")
+VALID_TECHNIQUES = frozenset(_TECHNIQUES)
+_VALID_TECHNIQUES_MSG = ", ".join(_TECHNIQUES)
 
 # Preset technique configurations (work_minutes, short_break, long_break, sessions_before_long)
 TECHNIQUE_PRESETS = {
@@ -168,9 +170,9 @@ def _validate_inputs(
     if total_minutes <= 0:
         raise ValueError("total_minutes must be positive")
 
-    if technique not in VALID_TECHNIQUES:
+    if not isinstance(technique, str) or technique not in VALID_TECHNIQUES:
         raise ValueError(
-            f"Invalid technique '{technique}'. Must be one of: {', '.join(VALID_TECHNIQUES)}"
+            f"Invalid technique '{technique}'. Must be one of: {_VALID_TECHNIQUES_MSG}"
         )
 
     if technique == "custom":
@@ -1,11 +1,15 @@
 """Task prioritization function for deepworks."""
 
+import numpy as np
 import pandas as pd
-from datetime import datetime, date
+from datetime import date, datetime
 from typing import Optional
 
-VALID_METHODS = ["weighted", "deadline"]
+_METHODS = ("weighted", "deadline")
+VALID_METHODS = frozenset(_METHODS)
+_VALID_METHODS_MSG = ", ".join(_METHODS)
 DEFAULT_WEIGHTS = {"importance": 0.5, "effort": 0.3, "deadline": 0.2}
+DEFAULT_FIELDS = {"importance": 3, "effort": 3}
 DATE_FMT = "%Y-%m-%d"
 
 
@@ -155,16 +159,20 @@ def prioritize_tasks(
     """
     _validate_inputs(tasks, method, weights)
 
-    effective_weights = weights if weights is not None else DEFAULT_WEIGHTS.copy()
+    effective_weights = weights if weights is not None else DEFAULT_WEIGHTS
+
+    df = pd.DataFrame(tasks)
+    days_left = _get_days_remaining(df)
 
     if method == "weighted":
-        scored_tasks = _calculate_weighted_scores(tasks, effective_weights)
+        df["priority_score"] = _calculate_weighted_scores(
+            df, days_left, effective_weights
+        )
     else:  # method == "deadline" (validated by _validate_inputs)
-        scored_tasks = _calculate_deadline_scores(tasks)
+        df["priority_score"] = _calculate_deadline_scores(days_left)
+        df["days_until_deadline"] = days_left
 
-    _assign_ranks(scored_tasks)
-
-    return pd.DataFrame(scored_tasks)
+    return _assign_ranks(df)
 
 
 def _validate_inputs(tasks: list, method: str, weights: Optional[dict]) -> None:
@@ -182,94 +190,83 @@ def _validate_inputs(tasks: list, method: str, weights: Optional[dict]) -> None:
         if "name" not in task:
             raise ValueError(f"Task at index {i} missing required field 'name'")
 
-    if method not in VALID_METHODS:
+    if not isinstance(method, str) or method not in VALID_METHODS:
         raise ValueError(
-            f"Invalid method '{method}'. Must be one of: {', '.join(VALID_METHODS)}"
+            f"Invalid method '{method}'. Must be one of: {_VALID_METHODS_MSG}"
         )
 
     if weights is not None and not isinstance(weights, dict):
         raise TypeError(f"weights must be a dict, got {type(weights).__name__}")
 
 
-def _get_days_remaining(deadline_str: Optional[str]) -> Optional[int]:
-    """Parses date string and returns days from today. Returns None if invalid/empty."""
-    if not deadline_str:
-        return None
-    try:
-        deadline = datetime.strptime(deadline_str, DATE_FMT).date()
-        return (deadline - date.today()).days
-    except (ValueError, TypeError):
-        return None
+def _get_days_remaining(df: pd.DataFrame) -> pd.Series:
+    """Parses the deadline column into days from today. NaN if invalid/empty."""
+    if "deadline" not in df:
+        return pd.Series(np.nan, index=df.index)
 
+    # Only date strings count as deadlines; anything else is treated as none
+    raw = df["deadline"].where(df["deadline"].map(lambda d: isinstance(d, str)))
+    deadlines = pd.to_datetime(raw, format=DATE_FMT, errors="coerce")
+    days_left = (deadlines - pd.Timestamp(date.today())).dt.days
 
-def _get_urgency_level(days_left: Optional[int]) -> int:
-    """Converts days remaining into a 1-5 urgency score."""
-    if days_left is None:
-        return 3  # Default middle score for no deadline
+    # pandas 2 coerces valid dates outside its nanosecond range to NaT, so
+    # re-parse those few strings in Python
+    missed = deadlines.isna() & raw.notna()
+    if missed.any():
+        days_left = days_left.astype(float)
+        days_left[missed] = raw[missed].map(_parse_days_remaining)
+    return days_left
 
-    if days_left <= 1:
-        return 5
-    elif days_left <= 3:
-        return 4
-    elif days_left <= 7:
-        return 3
-    elif days_left <= 14:
-        return 2
-    else:
-        return 1
 
+def _parse_days_remaining(deadline_str: str) -> float:
+    """Parses one date string into days from today. NaN if invalid."""
+    try:
+        return (datetime.strptime(deadline_str, DATE_FMT).date() - date.today()).days
+    except ValueError:
+        return np.nan
 
-def _calculate_weighted_scores(tasks: list[dict], weights: dict) -> list[dict]:
-    scored = []
 
+def _get_urgency_level(days_left: pd.Series) -> np.ndarray:
+    """Converts days remaining into a 1-5 urgency score."""
+    urgency = np.select(
+        [days_left <= 1, days_left <= 3, days_left <= 7, days_left <= 14],
+        [5, 4, 3, 2],
+        default=1,
+    )
+    # Default middle score for no deadline
+    return np.where(days_left.isna(), 3, urgency)
+
+
+def _calculate_weighted_scores(
+    df: pd.DataFrame, days_left: pd.Series, weights: dict
+) -> pd.Series:
     w_imp = weights.get("importance", 0.5)
     w_eff = weights.get("effort", 0.3)
     w_dead = weights.get("deadline", 0.2)
 
-    for task in tasks:
-        importance = task.get("importance", 3)
-        effort = task.get("effort", 3)
-
-        # 1. Get standardized days remaining
-        days_left = _get_days_remaining(task.get("deadline"))
+    # Missing columns and values both fall back to the defaults
+    fields = df.reindex(columns=list(DEFAULT_FIELDS)).fillna(DEFAULT_FIELDS)
+    importance = fields["importance"]
 
-        # 2. Convert to urgency level (1-5)
-        deadline_score = _get_urgency_level(days_left)
+    # Invert effort (Lower effort = higher priority)
+    effort_score = 6 - fields["effort"]
 
-        # 3. Invert effort (Lower effort = higher priority)
-        effort_score = 6 - effort
-
-        # 4. Final Weighted Calculation
-        score = (
-            (importance * w_imp) + (effort_score * w_eff) + (deadline_score * w_dead)
-        )
-
-        scored.append({**task, "priority_score": round(score, 2)})
-
-    return scored
+    deadline_score = _get_urgency_level(days_left)
 
+    score = (importance * w_imp) + (effort_score * w_eff) + (deadline_score * w_dead)
+    # Python's round() rather than Series.round(), which scales by 100 first
+    # and can land on the other side of a .5 boundary
+    return pd.Series([round(s, 2) for s in score.tolist()], index=df.index)
 
-def _calculate_deadline_scores(tasks: list[dict]) -> list[dict]:
-    scored = []
-
-    for task in tasks:
-        # 1. Reuse the same date parsing helper
-        days_left = _get_days_remaining(task.get("deadline"))
-
-        score = 0
-        if days_left is not None:
-            # Higher score for closer deadlines (invert days)
-            score = max(0, 100 - days_left)
-
-        scored.append(
-            {**task, "priority_score": score, "days_until_deadline": days_left}
-        )
 
-    return scored
+def _calculate_deadline_scores(days_left: pd.Series) -> pd.Series:
+    # Higher score for closer deadlines (invert days); no deadline scores 0
+    return (100 - days_left).clip(lower=0).fillna(0).astype(int)
 
 
-def _assign_ranks(scored_tasks: list[dict]) -> None:
-    """Sorts tasks in-place by priority score."""
-    scored_tasks.sort(key=lambda x: x["priority_score"], reverse=True)
-    for i, task in enumerate(scored_tasks):
-        task["rank"] = i + 1
+def _assign_ranks(df: pd.DataFrame) -> pd.DataFrame:
+    """Sorts tasks by priority score and assigns 1-based ranks."""
+    order = np.argsort(-df["priority_score"].to_numpy(), kind="stable")
+    df = df.iloc[order].reset_index(drop=True)
+    df["rank"] = np.arange(1, len(df) + 1)
+    return df
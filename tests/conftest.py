@@ -0,0 +1,5 @@
+"""Shared pytest configuration for the deepworks test suite."""
+
+# Import pandas once when the suite starts, so its import cost is paid up
+# front rather than during collection of whichever test module loads first.
+import pandas  # noqa: F401
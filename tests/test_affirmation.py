@@ -1,7 +1,8 @@
 """Tests for get_affirmation function."""
 
+import os
+
 import pytest
-from unittest.mock import MagicMock
 from deepworks.affirmation import get_affirmation
 
 # Basic functionality tests
@@ -50,6 +51,58 @@ def test_seed_reproducibility():
     result2 = get_affirmation(name="Alice", mood="happy", energy=5, seed=42)
     assert result1["text"] == result2["text"]
 
+def test_seed_does_not_affect_global_random_state():
+    """
+    Test that passing a seed leaves the global random module untouched.
+
+    Seeded calls use their own Random instance, so the next value drawn
+    from the global generator must be the same as if get_affirmation had
+    never been called.
+    """
+    import random
+
+    random.seed(123)
+    expected = random.random()
+
+    random.seed(123)
+    get_affirmation(name="Alice", mood="happy", energy=5, seed=42)
+    assert random.random() == expected
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_unseeded_calls_differ_across_forked_processes():
+    """
+    Test that forked processes do not repeat each other's unseeded draws.
+
+    Unseeded calls share one module-level generator, which must be reseeded
+    in each child after a fork. Otherwise every worker would inherit the
+    parent's state and produce the same sequence of affirmations.
+    """
+    get_affirmation(name="Alice", mood="happy", energy=5)
+    sequences = []
+    for _ in range(3):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Never return into pytest from the child, even on failure
+            exit_code = 1
+            try:
+                os.close(read_fd)
+                texts = [
+                    get_affirmation(name="Alice", mood="happy", energy=5)["text"]
+                    for _ in range(20)
+                ]
+                os.write(write_fd, "\n".join(texts).encode())
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as reader:
+            sequences.append(reader.read())
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+    assert len(set(sequences)) > 1
+
 # Mood tests
 
 def test_stressed_mood_prefers_selfcare():
@@ -67,6 +120,18 @@ def test_stressed_mood_prefers_selfcare():
     assert "self-care" in categories or "persistence" in categories
 
 
+def test_mood_and_category_are_case_insensitive():
+    """
+    Test that mood and category are matched regardless of case.
+
+    Mixed-case inputs should select the same affirmation as their
+    lowercase equivalents for the same seed.
+    """
+    mixed = get_affirmation(name="Test", mood="Stressed", energy=5, category="Growth", seed=7)
+    lower = get_affirmation(name="Test", mood="stressed", energy=5, category="growth", seed=7)
+    assert mixed == lower
+
+
 def test_specific_category_override():
     """
     Test that explicitly specifying a category overrides mood-based selection.
@@ -101,6 +166,18 @@ def test_name_capitalization():
     result = get_affirmation(name="alice", mood="happy", energy=5, seed=42)
     assert "Alice" in result["text"]
 
+
+def test_name_surrounding_whitespace_trimmed():
+    """
+    Test that leading and trailing whitespace is removed from the name.
+
+    A padded name like "  alice  " should be trimmed and capitalized to
+    "Alice" with no stray spaces left in the affirmation text.
+    """
+    result = get_affirmation(name="  alice  ", mood="happy", energy=5, seed=42)
+    assert "Alice" in result["text"]
+    assert "  " not in result["text"]
+
 # Exception tests
 
 def test_name_not_string_raises_typeerror():
@@ -212,25 +289,28 @@ def test_weighting_with_extreme_energy_mismatch():
     assert all("text" in r for r in results)
 
 
-def test_weighted_random_fallback_execution(monkeypatch):
+def test_weighted_random_draw_at_upper_bound(monkeypatch):
     """
-    Test that _weighted_random_choice hits the fallback return.
+    Test that an out-of-range random draw still selects a valid affirmation.
 
-    We mock random.Random to return an instance whose uniform method
-    returns a value larger than the total weights. This forces the
-    selection loop to finish without returning, triggering the safety
-    'return candidates[-1][0]' at the end.
+    We mock random.Random to return an instance whose random method
+    returns a value greater than 1. This pushes the draw past the total
+    weight, which must clamp to the final affirmation rather than
+    raising an IndexError.
     """
+    import random
+
     import deepworks.affirmation as affirmation_module
 
-    mock_rng = MagicMock()
-    mock_rng.uniform.return_value = 10000.0
+    rng = random.Random()
+    rng.random = lambda: 10000.0
 
-    monkeypatch.setattr(affirmation_module.random, "Random", lambda seed: mock_rng)
-    result = get_affirmation(name="Test", mood="happy", energy=5)
+    monkeypatch.setattr(affirmation_module.random, "Random", lambda seed: rng)
+    result = get_affirmation(name="Test", mood="happy", energy=5, seed=0)
 
-    # Verify we still got a valid result (the fallback worked)
-    assert result["text"]
+    assert result["text"] == affirmation_module.AFFIRMATIONS[-1]["text"].replace(
+        "{name}", "Test"
+    )
 
 # Testing different energy levels
 
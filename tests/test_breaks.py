@@ -459,6 +459,25 @@ def test_invalid_duration_raises_valueerror():
         suggest_break(minutes_worked=60, energy_level=5, duration=7)
 
 
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"break_type": ["active"]}, "Invalid break_type"),
+        ({"duration": [5]}, "Invalid duration"),
+    ],
+)
+def test_unhashable_option_raises_valueerror(kwargs, msg):
+    """
+    Test that unhashable break_type or duration values raise ValueError.
+
+    A list such as ['active'] or [5] cannot be looked up in the valid-option
+    sets, and should be reported with the same descriptive ValueError as any
+    other invalid option rather than a bare TypeError from hashing.
+    """
+    with pytest.raises(ValueError, match=msg):
+        suggest_break(minutes_worked=60, energy_level=5, **kwargs)
+
+
 def test_indoor_only_not_bool_raises_typeerror():
     """
     Test that non-boolean indoor_only raises TypeError.
@@ -5,18 +5,56 @@ import pandas as pd
 from deepworks.pomodoro import plan_pomodoro
 
 
-def test_returns_dataframe():
+def _work_durations(schedule):
+    """Return the durations of the work sessions as a NumPy array."""
+    durations = schedule["duration_minutes"].to_numpy()
+    return durations[schedule["type"].to_numpy() == "work"]
+
+
+@pytest.fixture(scope="session")
+def plans():
+    """
+    Schedules shared by read-only tests, keyed by their arguments.
+
+    plan_pomodoro is a pure function, so each distinct input is planned
+    once per test session instead of once per test. Keys are
+    (technique, total_minutes), plus (work_length, short_break) for the
+    custom technique. Tests must not modify the returned DataFrames.
+    """
+    # Expected: 15 minutes is shorter than one 25+5 pomodoro cycle
+    with pytest.warns(UserWarning, match="less than one work"):
+        short_plan = plan_pomodoro(15, "pomodoro")
+
+    return {
+        ("pomodoro", 60): plan_pomodoro(60, "pomodoro"),
+        ("pomodoro", 15): short_plan,
+        ("pomodoro", 180): plan_pomodoro(180, "pomodoro"),
+        ("52-17", 120): plan_pomodoro(120, "52-17"),
+        ("90-20", 180): plan_pomodoro(180, "90-20"),
+        ("custom", 60, 20, 5): plan_pomodoro(
+            60, "custom", work_length=20, short_break=5
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def default_plan(plans):
+    """Default 60-minute pomodoro schedule."""
+    return plans[("pomodoro", 60)]
+
+
+def test_returns_dataframe(default_plan):
     """
     Test that plan_pomodoro returns a pandas DataFrame.
 
     The function should always return a pd.DataFrame containing the
     work/break schedule, regardless of the technique or time budget used.
     """
-    result = plan_pomodoro(total_minutes=60)
-    assert isinstance(result, pd.DataFrame)
+    result = default_plan
+    assert type(result) is pd.DataFrame
 
 
-def test_has_required_columns():
+def test_has_required_columns(default_plan):
     """
     Test that the returned DataFrame contains all required columns.
 
@@ -24,28 +62,12 @@ def test_has_required_columns():
     'type' (work/short_break/long_break), 'duration_minutes' (session length),
     'start_minute' (inclusive start), and 'end_minute' (exclusive end).
     """
-    result = plan_pomodoro(total_minutes=60)
-    assert "session" in result.columns
-    assert "type" in result.columns
-    assert "duration_minutes" in result.columns
-    assert "start_minute" in result.columns
-    assert "end_minute" in result.columns
+    required = {"session", "type", "duration_minutes", "start_minute", "end_minute"}
+    missing = required - set(default_plan.columns)
+    assert not missing, f"missing columns: {sorted(missing)}"
 
 
-def test_pomodoro_technique_25_5():
-    """
-    Test that the 'pomodoro' technique uses 25-minute work sessions.
-
-    The classic Pomodoro Technique preset uses 25-minute work sessions
-    with 5-minute short breaks. This verifies the first work session
-    has the expected 25-minute duration.
-    """
-    result = plan_pomodoro(total_minutes=60, technique="pomodoro")
-    work_sessions = result[result["type"] == "work"]
-    assert work_sessions.iloc[0]["duration_minutes"] == 25
-
-
-def test_schedule_starts_at_zero():
+def test_schedule_starts_at_zero(default_plan):
     """
     Test that the schedule always begins at minute 0.
 
@@ -53,37 +75,27 @@ def test_schedule_starts_at_zero():
     schedule represents time from the beginning of the available window.
     The first session is always a work session.
     """
-    result = plan_pomodoro(total_minutes=60)
-    assert result.iloc[0]["start_minute"] == 0
-
-
-def test_52_17_technique():
-    """
-    Test that the '52-17' technique uses 52-minute work sessions.
+    result = default_plan
+    assert result["start_minute"].iat[0] == 0
 
-    The 52-17 technique preset uses 52-minute work sessions with
-    17-minute breaks, based on productivity research. This verifies
-    the first work session has the expected 52-minute duration.
-    """
-    result = plan_pomodoro(total_minutes=120, technique="52-17")
-    work_sessions = result[result["type"] == "work"]
-    assert work_sessions.iloc[0]["duration_minutes"] == 52
 
-
-def test_90_20_technique():
+@pytest.mark.parametrize(
+    "total,technique,expected",
+    [(60, "pomodoro", 25), (120, "52-17", 52), (180, "90-20", 90)],
+)
+def test_technique_work_length(plans, total, technique, expected):
     """
-    Test that the '90-20' technique uses 90-minute work sessions.
+    Test that each preset technique uses its documented work length.
 
-    The 90-20 technique preset uses 90-minute work sessions with
-    20-minute short breaks and 30-minute long breaks, aligned with
-    ultradian rhythms. This verifies the first work session duration.
+    The classic 'pomodoro' preset uses 25-minute work sessions with
+    5-minute short breaks, '52-17' uses 52-minute sessions with 17-minute
+    breaks, and '90-20' uses 90-minute sessions aligned with ultradian
+    rhythms. This verifies the first work session of each schedule.
     """
-    result = plan_pomodoro(total_minutes=180, technique="90-20")
-    work_sessions = result[result["type"] == "work"]
-    assert work_sessions.iloc[0]["duration_minutes"] == 90
+    assert _work_durations(plans[(technique, total)])[0] == expected
 
 
-def test_custom_technique():
+def test_custom_technique(plans):
     """
     Test that the 'custom' technique uses user-specified work/break lengths.
 
@@ -91,17 +103,11 @@ def test_custom_technique():
     parameters to define their own schedule. This verifies custom durations
     are correctly applied to work sessions.
     """
-    result = plan_pomodoro(
-        total_minutes=60,
-        technique="custom",
-        work_length=20,
-        short_break=5
-    )
-    work_sessions = result[result["type"] == "work"]
-    assert work_sessions.iloc[0]["duration_minutes"] == 20
+    result = plans[("custom", 60, 20, 5)]
+    assert _work_durations(result)[0] == 20
 
 
-def test_short_time_partial_session():
+def test_short_time_partial_session(plans):
     """
     Test that sessions are truncated when time budget is insufficient.
 
@@ -110,11 +116,11 @@ def test_short_time_partial_session():
     are never created. Here, 15 minutes is less than the 25-minute pomodoro
     work session, so it gets truncated to 15 minutes.
     """
-    result = plan_pomodoro(total_minutes=15, technique="pomodoro")
-    assert result.iloc[0]["duration_minutes"] == 15
+    result = plans[("pomodoro", 15)]
+    assert result["duration_minutes"].iat[0] == 15
 
 
-def test_long_break_interval():
+def test_long_break_interval(plans):
     """
     Test that long breaks are inserted after the configured interval.
 
@@ -122,150 +128,117 @@ def test_long_break_interval():
     4th work session. With 180 minutes, there should be enough time to
     complete 4 work sessions and trigger at least one long break.
     """
-    result = plan_pomodoro(total_minutes=180, technique="pomodoro")
-    long_breaks = result[result["type"] == "long_break"]
-    assert len(long_breaks) >= 1
-
-
-def test_total_minutes_not_int_raises_typeerror():
-    """
-    Test that passing a non-integer total_minutes raises TypeError.
-
-    The total_minutes parameter must be an integer. Passing a string
-    (or any non-int type) should raise a TypeError with a descriptive message.
-    """
-    with pytest.raises(TypeError, match="total_minutes must be an integer"):
-        plan_pomodoro(total_minutes="60")
-
-
-def test_total_minutes_not_positive_raises_valueerror():
-    """
-    Test that passing zero or negative total_minutes raises ValueError.
-
-    The total_minutes parameter must be greater than 0. Passing zero
-    should raise a ValueError indicating the value must be positive.
-    """
-    with pytest.raises(ValueError, match="must be positive"):
-        plan_pomodoro(total_minutes=0)
-
-
-def test_invalid_technique_raises_valueerror():
-    """
-    Test that passing an invalid technique name raises ValueError.
-
-    The technique parameter must be one of: 'pomodoro', '52-17', '90-20',
-    or 'custom'. Passing an unrecognized technique name should raise
-    a ValueError listing the valid options.
-    """
+    result = plans[("pomodoro", 180)]
+    assert (result["type"].to_numpy() == "long_break").sum() >= 1
+
+
+# Invalid inputs: (expected exception, message pattern, plan_pomodoro kwargs).
+# Numeric parameters must be integers (floats, strings and bools are
+# rejected) and positive; technique must be a known preset, and "custom"
+# requires both work_length and short_break.
+EXC_CASES = [
+    pytest.param(
+        TypeError, "total_minutes must be an integer",
+        dict(total_minutes="60"),
+        id="total_minutes_not_int",
+    ),
+    pytest.param(
+        ValueError, "must be positive",
+        dict(total_minutes=0),
+        id="total_minutes_not_positive",
+    ),
+    pytest.param(
+        ValueError, "Invalid technique",
+        dict(total_minutes=60, technique="invalid"),
+        id="invalid_technique",
+    ),
+    pytest.param(
+        ValueError, "Invalid technique",
+        dict(total_minutes=60, technique=["pomodoro"]),
+        id="unhashable_technique",
+    ),
+    pytest.param(
+        ValueError, "requires work_length and short_break",
+        dict(total_minutes=60, technique="custom"),
+        id="custom_missing_params",
+    ),
+    pytest.param(
+        TypeError, "work_length must be an integer",
+        dict(total_minutes=60, technique="custom", work_length=25.5, short_break=5),
+        id="work_length_not_int",
+    ),
+    pytest.param(
+        TypeError, "short_break must be an integer",
+        dict(total_minutes=60, technique="custom", work_length=25, short_break="5"),
+        id="short_break_not_int",
+    ),
+    pytest.param(
+        TypeError, "long_break must be an integer",
+        dict(total_minutes=60, technique="pomodoro", long_break=15.0),
+        id="long_break_not_int",
+    ),
+    pytest.param(
+        TypeError, "long_break_interval must be an integer",
+        dict(total_minutes=60, technique="custom", work_length=25, short_break=5, long_break_interval=4.0),
+        id="long_break_interval_not_int",
+    ),
+    pytest.param(
+        ValueError, "work_length must be positive",
+        dict(total_minutes=60, technique="custom", work_length=0, short_break=5),
+        id="work_length_not_positive",
+    ),
+    pytest.param(
+        ValueError, "short_break must be positive",
+        dict(total_minutes=60, technique="custom", work_length=25, short_break=-1),
+        id="short_break_not_positive",
+    ),
+    pytest.param(
+        ValueError, "long_break must be positive",
+        dict(total_minutes=60, technique="pomodoro", long_break=0),
+        id="long_break_not_positive",
+    ),
+    pytest.param(
+        ValueError, "long_break_interval must be positive",
+        dict(total_minutes=60, technique="custom", work_length=25, short_break=5, long_break_interval=0),
+        id="long_break_interval_not_positive",
+    ),
+]
+
+
+@pytest.mark.parametrize("exc,msg,kwargs", EXC_CASES)
+def test_invalid_inputs_raise(exc, msg, kwargs):
+    """
+    Test that invalid arguments raise the expected exception and message.
+
+    Each case passes one invalid argument (wrong type, non-positive value,
+    unknown technique, or incomplete custom configuration) and checks that
+    plan_pomodoro raises the matching TypeError or ValueError.
+    """
+    with pytest.raises(exc, match=msg):
+        plan_pomodoro(**kwargs)
+
+
+def test_validation_fails_before_dataframe_build(monkeypatch):
+    """
+    Test that an invalid argument is rejected before any DataFrame is built.
+
+    The module's pandas reference is swapped for a stub whose DataFrame
+    constructor fails the test, so the invalid call must raise its
+    validation error without reaching schedule construction. This keeps
+    the fast-fail path cheap if validation is ever reordered.
+    """
+    import types
+
+    import deepworks.pomodoro as pomodoro_module
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("DataFrame built before validation failed")
+
+    monkeypatch.setattr(pomodoro_module, "pd", types.SimpleNamespace(DataFrame=_fail))
     with pytest.raises(ValueError, match="Invalid technique"):
         plan_pomodoro(total_minutes=60, technique="invalid")
 
 
-def test_custom_missing_params_raises_valueerror():
-    """
-    Test that custom technique without required parameters raises ValueError.
-
-    When technique='custom', both work_length and short_break parameters
-    are required. Omitting these should raise a ValueError explaining
-    which parameters are needed.
-    """
-    with pytest.raises(ValueError, match="requires work_length and short_break"):
-        plan_pomodoro(total_minutes=60, technique="custom")
-
-
-def test_work_length_not_int_raises_typeerror():
-    """
-    Test that passing a non-integer work_length raises TypeError.
-
-    The work_length parameter must be an integer when provided. Passing
-    a float (25.5) should raise a TypeError with a descriptive message.
-    Boolean values are also not accepted as integers.
-    """
-    with pytest.raises(TypeError, match="work_length must be an integer"):
-        plan_pomodoro(total_minutes=60, technique="custom", work_length=25.5, short_break=5)
-
-
-def test_short_break_not_int_raises_typeerror():
-    """
-    Test that passing a non-integer short_break raises TypeError.
-
-    The short_break parameter must be an integer when provided. Passing
-    a string ("5") should raise a TypeError with a descriptive message.
-    """
-    with pytest.raises(TypeError, match="short_break must be an integer"):
-        plan_pomodoro(total_minutes=60, technique="custom", work_length=25, short_break="5")
-
-
-def test_long_break_not_int_raises_typeerror():
-    """
-    Test that passing a non-integer long_break raises TypeError.
-
-    The long_break parameter must be an integer when provided. Passing
-    a float (15.0) should raise a TypeError with a descriptive message.
-    """
-    with pytest.raises(TypeError, match="long_break must be an integer"):
-        plan_pomodoro(total_minutes=60, technique="pomodoro", long_break=15.0)
-
-
-def test_long_break_interval_not_int_raises_typeerror():
-    """
-    Test that passing a non-integer long_break_interval raises TypeError.
-
-    The long_break_interval parameter must be an integer. Passing a float
-    (4.0) should raise a TypeError with a descriptive message.
-    """
-    with pytest.raises(TypeError, match="long_break_interval must be an integer"):
-        plan_pomodoro(total_minutes=60, technique="custom", work_length=25, short_break=5, long_break_interval=4.0)
-
-
-def test_work_length_not_positive_raises_valueerror():
-    """
-    Test that passing zero or negative work_length raises ValueError.
-
-    The work_length parameter must be greater than 0 when provided.
-    Passing zero should raise a ValueError indicating the value must
-    be positive.
-    """
-    with pytest.raises(ValueError, match="work_length must be positive"):
-        plan_pomodoro(total_minutes=60, technique="custom", work_length=0, short_break=5)
-
-
-def test_short_break_not_positive_raises_valueerror():
-    """
-    Test that passing zero or negative short_break raises ValueError.
-
-    The short_break parameter must be greater than 0 when provided.
-    Passing a negative value (-1) should raise a ValueError indicating
-    the value must be positive.
-    """
-    with pytest.raises(ValueError, match="short_break must be positive"):
-        plan_pomodoro(total_minutes=60, technique="custom", work_length=25, short_break=-1)
-
-
-def test_long_break_not_positive_raises_valueerror():
-    """
-    Test that passing zero or negative long_break raises ValueError.
-
-    The long_break parameter must be greater than 0 when provided.
-    Passing zero should raise a ValueError indicating the value must
-    be positive.
-    """
-    with pytest.raises(ValueError, match="long_break must be positive"):
-        plan_pomodoro(total_minutes=60, technique="pomodoro", long_break=0)
-
-
-def test_long_break_interval_not_positive_raises_valueerror():
-    """
-    Test that passing zero or negative long_break_interval raises ValueError.
-
-    The long_break_interval parameter must be at least 1 (meaning a long
-    break occurs after at least 1 work session). Passing zero should raise
-    a ValueError indicating the value must be positive.
-    """
-    with pytest.raises(ValueError, match="long_break_interval must be positive"):
-        plan_pomodoro(total_minutes=60, technique="custom", work_length=25, short_break=5, long_break_interval=0)
-
-
 def test_custom_uses_explicit_long_break_and_can_truncate_break():
     """
     Custom technique should use provided long_break (not default to short_break).
@@ -280,8 +253,8 @@ def test_custom_uses_explicit_long_break_and_can_truncate_break():
         long_break_interval=1,  # long break after every work session
     )
 
-    assert result.iloc[1]["type"] == "long_break"
-    assert result.iloc[1]["duration_minutes"] == 8
+    assert result["type"].iat[1] == "long_break"
+    assert result["duration_minutes"].iat[1] == 8
 
     # Total time should never exceed the budget
     assert result["end_minute"].max() == 30
@@ -303,12 +276,12 @@ def test_preset_allows_overrides_for_work_and_breaks():
     )
 
     # First work session should use override (10)
-    assert result.iloc[0]["type"] == "work"
-    assert result.iloc[0]["duration_minutes"] == 10
+    assert result["type"].iat[0] == "work"
+    assert result["duration_minutes"].iat[0] == 10
 
     # First break should use override short_break (3)
-    assert result.iloc[1]["type"] == "short_break"
-    assert result.iloc[1]["duration_minutes"] == 3
+    assert result["type"].iat[1] == "short_break"
+    assert result["duration_minutes"].iat[1] == 3
 
 
 def test_schedule_ends_exactly_on_budget():
@@ -318,7 +291,7 @@ def test_schedule_ends_exactly_on_budget():
     df = plan_pomodoro(total_minutes=30, technique="pomodoro")
 
     # Should end exactly at 30 minutes
-    assert df.iloc[-1]["end_minute"] == 30
+    assert df["end_minute"].iat[-1] == 30
 
     # Should include exactly: 25 work + 5 short break
     assert df["type"].tolist() == ["work", "short_break"]
@@ -19,7 +19,7 @@ def test_weighted_method_returns_dataframe():
         {"name": "Task B", "importance": 3, "effort": 4},
     ]
     result = prioritize_tasks(tasks, method="weighted")
-    assert isinstance(result, pd.DataFrame)
+    assert type(result) is pd.DataFrame
 
 def test_weighted_method_has_required_columns():
     """
@@ -73,7 +73,7 @@ def test_deadline_method_returns_dataframe():
         {"name": "Task B", "deadline": "2026-01-20"},
     ]
     result = prioritize_tasks(tasks, method="deadline")
-    assert isinstance(result, pd.DataFrame)
+    assert type(result) is pd.DataFrame
 
 def test_invalid_date_format_handling():
     """
@@ -246,6 +246,18 @@ def test_invalid_method_raises_valueerror():
         prioritize_tasks([{"name": "Task"}], method="invalid")
 
 
+def test_unhashable_method_raises_valueerror():
+    """
+    Test that an unhashable method such as a list raises a ValueError.
+
+    The method is checked against the set of valid methods, so a value like
+    ['weighted'] should be rejected with the usual 'Invalid method' message
+    instead of failing with a TypeError while hashing.
+    """
+    with pytest.raises(ValueError, match="Invalid method"):
+        prioritize_tasks([{"name": "Task"}], method=["weighted"])
+
+
 def test_invalid_weights_type_raises_typeerror():
     """
     Test that passing a non-dictionary type for weights raises a TypeError.
@@ -386,4 +398,101 @@ def test_lower_effort_ranks_higher():
     result = prioritize_tasks(tasks, method="weighted")
     easy_rank = result[result["name"] == "Easy"]["rank"].values[0]
     hard_rank = result[result["name"] == "Hard"]["rank"].values[0]
-    assert easy_rank < hard_rank  # Lower rank number = higher priority
\ No newline at end of file
+    assert easy_rank < hard_rank  # Lower rank number = higher priority
+
+
+def test_tied_scores_keep_input_order():
+    """
+    Test that tasks with equal priority scores keep their input order.
+
+    Ranking uses a stable sort, so when several tasks share the same
+    score the one listed first in the input receives the better rank.
+    """
+    tasks = [
+        {"name": "First", "importance": 3, "effort": 3},
+        {"name": "Top", "importance": 5, "effort": 3},
+        {"name": "Second", "importance": 3, "effort": 3},
+        {"name": "Third", "importance": 3, "effort": 3},
+    ]
+    result = prioritize_tasks(tasks)
+    assert list(result["name"]) == ["Top", "First", "Second", "Third"]
+    assert list(result["rank"]) == [1, 2, 3, 4]
+
+
+def test_deadline_without_zero_padding_is_parsed():
+    """
+    Test that deadlines without zero-padded month/day are still parsed.
+
+    Deadlines are parsed with the 'YYYY-MM-DD' format, which also accepts
+    single-digit months and days (e.g. '2026-1-5'), so such tasks get a
+    real days_until_deadline rather than being treated as undated.
+    """
+    from datetime import date, timedelta
+    soon = date.today() + timedelta(days=5)
+    tasks = [{"name": "Unpadded", "deadline": f"{soon.year}-{soon.month}-{soon.day}"}]
+    result = prioritize_tasks(tasks, method="deadline")
+    assert result.iloc[0]["days_until_deadline"] == 5
+    assert result.iloc[0]["priority_score"] == 95
+
+
+def test_non_string_deadline_treated_as_no_deadline():
+    """
+    Test that a deadline that is not a string counts as no deadline.
+
+    Deadlines must be 'YYYY-MM-DD' strings. Other values, such as a
+    datetime.date object, are treated like a missing deadline: the task
+    gets a deadline-method score of 0 and no days_until_deadline.
+    """
+    from datetime import date, timedelta
+    soon = date.today() + timedelta(days=1)
+    result = prioritize_tasks([{"name": "Date object", "deadline": soon}], method="deadline")
+    assert result.iloc[0]["priority_score"] == 0
+    assert pd.isna(result.iloc[0]["days_until_deadline"])
+
+
+def test_deadline_outside_timestamp_range_is_parsed():
+    """
+    Test that valid deadlines far in the past or future are still parsed.
+
+    pandas timestamps only cover roughly the years 1677-2262, but any valid
+    'YYYY-MM-DD' string is a real deadline: '2300-01-01' gets the lowest
+    urgency in weighted mode and its day count in deadline mode.
+    """
+    from datetime import date
+    tasks = [{"name": "Far off", "deadline": "2300-01-01"}]
+    weighted = prioritize_tasks(tasks)
+    assert weighted.iloc[0]["priority_score"] == 2.6
+    by_deadline = prioritize_tasks(tasks, method="deadline")
+    expected_days = (date(2300, 1, 1) - date.today()).days
+    assert by_deadline.iloc[0]["days_until_deadline"] == expected_days
+
+
+def test_weighted_score_rounds_like_builtin_round():
+    """
+    Test that weighted scores are rounded with Python's built-in round().
+
+    With these weights the raw score is 2.665 in floating point; round()
+    gives 2.67, whereas scaling by 100 before rounding would give 2.66.
+    """
+    tasks = [{"name": "a", "importance": 5, "effort": 4, "deadline": "2099-01-01"}]
+    weights = {"importance": 0.333, "effort": 0.333, "deadline": 0.334}
+    result = prioritize_tasks(tasks, weights=weights)
+    assert result.iloc[0]["priority_score"] == 2.67
+
+
+def test_input_tasks_not_modified():
+    """
+    Test that prioritize_tasks does not mutate the caller's task dicts.
+
+    Scores and ranks are added as DataFrame columns, so the input list
+    and its dictionaries must come back exactly as they were passed in,
+    for both the weighted and deadline methods.
+    """
+    tasks = [
+        {"name": "A", "importance": 5, "effort": 2, "deadline": "2026-01-15"},
+        {"name": "B"},
+    ]
+    original = [dict(task) for task in tasks]
+    prioritize_tasks(tasks, method="weighted")
+    prioritize_tasks(tasks, method="deadline")
+    assert tasks == original